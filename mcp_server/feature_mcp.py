@@ -100,6 +100,39 @@ _engine = None
 # not cross-process. In parallel mode, multiple MCP servers run in separate
 # processes, so the lock was useless. We now use atomic SQL operations instead.
 
+# Atomic state-transition statements, built once at import and reused by every
+# tool call instead of re-parsing the SQL text into a new TextClause each time.
+_MARK_PASSING_STMT = text("""
+    UPDATE features
+    SET passes = 1, in_progress = 0
+    WHERE id = :id AND passes = 0
+""")
+
+_MARK_FAILING_STMT = text("""
+    UPDATE features
+    SET passes = 0, in_progress = 0
+    WHERE id = :id
+""")
+
+_SKIP_STMT = text("""
+    UPDATE features
+    SET priority = (SELECT COALESCE(MAX(priority), 0) + 1 FROM features),
+        in_progress = 0
+    WHERE id = :id
+""")
+
+_CLAIM_STMT = text("""
+    UPDATE features
+    SET in_progress = 1
+    WHERE id = :id AND passes = 0 AND in_progress = 0 AND needs_human_input = 0
+""")
+
+_CLEAR_IN_PROGRESS_STMT = text("""
+    UPDATE features
+    SET in_progress = 0
+    WHERE id = :id
+""")
+
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP):
@@ -249,25 +282,21 @@ def feature_mark_passing(
     session = get_session()
     try:
         # Atomic update with state guard - prevents double-pass in parallel mode
-        result = session.execute(text("""
-            UPDATE features
-            SET passes = 1, in_progress = 0
-            WHERE id = :id AND passes = 0
-        """), {"id": feature_id})
+        result = session.execute(_MARK_PASSING_STMT, {"id": feature_id})
         session.commit()
 
         if result.rowcount == 0:
-            # Check why the update didn't match
-            feature = session.query(Feature).filter(Feature.id == feature_id).first()
-            if feature is None:
+            # Check why the update didn't match (column-only read, no ORM hydration)
+            row = session.query(Feature.passes).filter(Feature.id == feature_id).first()
+            if row is None:
                 return json.dumps({"error": f"Feature with ID {feature_id} not found"})
-            if feature.passes:
+            if row.passes:
                 return json.dumps({"error": f"Feature with ID {feature_id} is already passing"})
             return json.dumps({"error": "Failed to mark feature passing for unknown reason"})
 
         # Get the feature name for the response
-        feature = session.query(Feature).filter(Feature.id == feature_id).first()
-        return json.dumps({"success": True, "feature_id": feature_id, "name": feature.name})
+        name = session.query(Feature.name).filter(Feature.id == feature_id).scalar()
+        return json.dumps({"success": True, "feature_id": feature_id, "name": name})
     except Exception as e:
         session.rollback()
         return json.dumps({"error": f"Failed to mark feature passing: {str(e)}"})
@@ -305,11 +334,7 @@ def feature_mark_failing(
             return json.dumps({"error": f"Feature with ID {feature_id} not found"})
 
         # Atomic update for parallel safety
-        session.execute(text("""
-            UPDATE features
-            SET passes = 0, in_progress = 0
-            WHERE id = :id
-        """), {"id": feature_id})
+        session.execute(_MARK_FAILING_STMT, {"id": feature_id})
         session.commit()
 
         # Refresh to get updated state
@@ -362,12 +387,7 @@ def feature_skip(
 
         # Atomic update: set priority to max+1 in a single statement
         # This prevents race conditions where two features get the same priority
-        session.execute(text("""
-            UPDATE features
-            SET priority = (SELECT COALESCE(MAX(priority), 0) + 1 FROM features),
-                in_progress = 0
-            WHERE id = :id
-        """), {"id": feature_id})
+        session.execute(_SKIP_STMT, {"id": feature_id})
         session.commit()
 
         # Refresh to get new priority
@@ -406,11 +426,7 @@ def feature_mark_in_progress(
     session = get_session()
     try:
         # Atomic claim: only succeeds if feature is not already claimed, passing, or blocked for human input
-        result = session.execute(text("""
-            UPDATE features
-            SET in_progress = 1
-            WHERE id = :id AND passes = 0 AND in_progress = 0 AND needs_human_input = 0
-        """), {"id": feature_id})
+        result = session.execute(_CLAIM_STMT, {"id": feature_id})
         session.commit()
 
         if result.rowcount == 0:
@@ -465,11 +481,7 @@ def feature_claim_and_get(
             return json.dumps({"error": f"Feature with ID {feature_id} is blocked waiting for human input"})
 
         # Try atomic claim: only succeeds if not already claimed and not blocked for human input
-        result = session.execute(text("""
-            UPDATE features
-            SET in_progress = 1
-            WHERE id = :id AND passes = 0 AND in_progress = 0 AND needs_human_input = 0
-        """), {"id": feature_id})
+        result = session.execute(_CLAIM_STMT, {"id": feature_id})
         session.commit()
 
         # Determine if we claimed it or it was already claimed
@@ -515,11 +527,7 @@ def feature_clear_in_progress(
             return json.dumps({"error": f"Feature with ID {feature_id} not found"})
 
         # Atomic update - idempotent, safe in parallel mode
-        session.execute(text("""
-            UPDATE features
-            SET in_progress = 0
-            WHERE id = :id
-        """), {"id": feature_id})
+        session.execute(_CLEAR_IN_PROGRESS_STMT, {"id": feature_id})
         session.commit()
 
         session.refresh(feature)
@@ -964,8 +972,10 @@ def feature_set_dependencies(
                 return json.dumps({"error": f"Feature {feature_id} not found"})
 
             # Validate all dependencies exist
-            all_feature_ids = {f.id for f in session.query(Feature).all()}
-            missing = [d for d in dependency_ids if d not in all_feature_ids]
+            existing_ids = {
+                row.id for row in session.query(Feature.id).filter(Feature.id.in_(dependency_ids))
+            }
+            missing = [d for d in dependency_ids if d not in existing_ids]
             if missing:
                 return json.dumps({"error": f"Dependencies not found: {missing}"})
 
@@ -1084,21 +1094,21 @@ def feature_request_human_input(
         session.commit()
 
         if result.rowcount == 0:
-            feature = session.query(Feature).filter(Feature.id == feature_id).first()
-            if feature is None:
+            row = session.query(Feature.passes, Feature.in_progress).filter(Feature.id == feature_id).first()
+            if row is None:
                 return json.dumps({"error": f"Feature with ID {feature_id} not found"})
-            if feature.passes:
+            if row.passes:
                 return json.dumps({"error": f"Feature with ID {feature_id} is already passing"})
-            if not feature.in_progress:
+            if not row.in_progress:
                 return json.dumps({"error": f"Feature with ID {feature_id} is not in progress"})
             return json.dumps({"error": "Failed to request human input for unknown reason"})
 
-        feature = session.query(Feature).filter(Feature.id == feature_id).first()
+        name = session.query(Feature.name).filter(Feature.id == feature_id).scalar()
         return json.dumps({
             "success": True,
             "feature_id": feature_id,
-            "name": feature.name,
-            "message": f"Feature '{feature.name}' is now blocked waiting for human input"
+            "name": name,
+            "message": f"Feature '{name}' is now blocked waiting for human input"
         })
     except Exception as e:
         session.rollback()
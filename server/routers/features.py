@@ -786,8 +786,10 @@ async def set_dependencies(project_name: str, feature_id: int, update: Dependenc
                 raise HTTPException(status_code=404, detail=f"Feature {feature_id} not found")
 
             # Validate all dependencies exist
-            all_feature_ids = {f.id for f in session.query(Feature).all()}
-            missing = [d for d in dependency_ids if d not in all_feature_ids]
+            existing_ids = {
+                row.id for row in session.query(Feature.id).filter(Feature.id.in_(dependency_ids))
+            }
+            missing = [d for d in dependency_ids if d not in existing_ids]
             if missing:
                 raise HTTPException(status_code=400, detail=f"Dependencies not found: {missing}")
 